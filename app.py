@@ -1,11 +1,10 @@
 # === BOOT LOG ===
 print("BOOT: app.py loaded", flush=True)
 
-import os, math, re, json, traceback
+import os, math, re, json, traceback, importlib, gc
 from typing import Optional, Dict, Any, List
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory
 from dotenv import load_dotenv
-import networkx as nx
 
 # .env 로드 (명시 경로로 안전하게)
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -17,7 +16,9 @@ from calculator import compute_ebct
 import knowledge_graph as kg
 
 # ---- Knowledge Graph & Gemini ----
-G = kg.get_graph()
+# 읽기 전용 상태(그래프 + alias 인덱스 + 직렬화 payload)는 import 시점에 한 번만 만든다.
+# gunicorn preload 모드에서는 fork 전에 만들어지고, gunicorn.conf.py의 gc.freeze()로 워커들이 공유한다.
+G = kg.preload()
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
 
@@ -30,6 +31,28 @@ if GEMINI_API_KEY:
     except Exception as e:
         print("[warn] google-generativeai import failed:", e, flush=True)
 
+def reload_state():
+    """
+    Re-imports knowledge_graph and rebuilds the shared state (graph + index + payload).
+    실패하면 로그만 남기고 이전 모듈/그래프를 그대로 유지한다 (HUP으로 서버가 죽지 않도록).
+    """
+    global G
+    snapshot = dict(vars(kg))
+    gc.unfreeze()
+    try:
+        importlib.reload(kg)  # 수정된 knowledge_graph.py 정의를 master에 다시 로드
+        new_G = kg.reload_graph()
+    except Exception as e:
+        vars(kg).clear()
+        vars(kg).update(snapshot)
+        print("[reload] failed, keeping previous knowledge graph:", e, "\n", traceback.format_exc(), flush=True)
+    else:
+        G = new_G
+        print("RELOAD: knowledge graph rebuilt", flush=True)
+    finally:
+        gc.freeze()
+    return G
+
 # Flask app
 app = Flask(__name__, static_folder="static")
 
@@ -62,9 +85,8 @@ def calculate():
 @app.get("/api/knowledge-graph")
 def get_knowledge_graph():
     """Returns the knowledge graph data as a JSON object."""
-    # Convert NetworkX graph to a dictionary format suitable for D3.js
-    graph_data = nx.node_link_data(G)
-    return jsonify(graph_data)
+    # D3.js용 node-link JSON은 미리 직렬화해 둔 것을 그대로 내보냄
+    return Response(kg.get_graph_json(), mimetype="application/json")
 
 # ----------------- 유틸 -----------------
 def _num(x, d: int = 4):
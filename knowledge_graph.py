@@ -1,16 +1,63 @@
 import networkx as nx
+import json
 import re
-from typing import Optional, Tuple
+import threading
+from typing import Dict, Optional, Tuple
 
 _G = None
+_G_JSON = None
+_ALIAS_INDEX = None
+_G_LOCK = threading.Lock()
+
+def _build_alias_index(G) -> Dict[str, str]:
+    """alias → node name (first node wins, same as the linear scan)."""
+    index = {}
+    for node, data in G.nodes(data=True):
+        for alias in data.get('aliases', []):
+            index.setdefault(alias, node)
+    return index
 
 def get_graph():
-    """Singleton accessor for the knowledge graph."""
-    global _G
+    """Singleton accessor for the knowledge graph (thread-safe, built once with its alias index)."""
+    global _G, _ALIAS_INDEX
     if _G is None:
-        _G = create_knowledge_graph()
+        with _G_LOCK:
+            if _G is None:
+                G = create_knowledge_graph()
+                _ALIAS_INDEX = _build_alias_index(G)
+                _G = G
     return _G
 
+def _dump_graph(G) -> str:
+    """Same bytes Flask's jsonify(nx.node_link_data(G)) produced: sorted keys, ASCII, compact."""
+    return json.dumps(nx.node_link_data(G), sort_keys=True, ensure_ascii=True, separators=(",", ":")) + "\n"
+
+def get_graph_json() -> str:
+    """Serialized node-link JSON of the graph, built once and reused."""
+    global _G_JSON
+    if _G_JSON is None:
+        G = get_graph()
+        with _G_LOCK:
+            if _G_JSON is None:
+                _G_JSON = _dump_graph(G)
+    return _G_JSON
+
+def preload():
+    """Builds all read-only state (graph, alias index, serialized payload) up front, e.g. before forking."""
+    G = get_graph()
+    get_graph_json()
+    return G
+
+def reload_graph():
+    """Rebuilds the graph, alias index and serialized payload, then swaps them in atomically."""
+    global _G, _G_JSON, _ALIAS_INDEX
+    G = create_knowledge_graph()
+    index = _build_alias_index(G)
+    payload = _dump_graph(G)
+    with _G_LOCK:
+        _G, _G_JSON, _ALIAS_INDEX = G, payload, index
+    return G
+
 def create_knowledge_graph():
     """
     Creates and populates the knowledge graph with concepts, risks, and advice.
@@ -79,11 +126,27 @@ def create_knowledge_graph():
 
 def find_node_by_alias(graph: nx.DiGraph, alias: str) -> Optional[str]:
     """Finds a node in the graph by its alias."""
+    if graph is _G and _ALIAS_INDEX is not None:
+        return _ALIAS_INDEX.get(alias.lower())
     for node, data in graph.nodes(data=True):
         if 'aliases' in data and alias.lower() in data['aliases']:
             return node
     return None
 
+# Simple regex for now, can be improved with NLP (compiled once at import)
+_CONCEPT_PATTERNS = {
+    "EBCT": re.compile(r"(ebct가\s*뭐|what\s*is\s*ebct)", re.I),
+    "V": re.compile(r"(\bV\b|volume|볼륨).*(뭐|what)|(V|volume|볼륨)\s*가\s*뭐", re.I),
+    "Q": re.compile(r"(\bQ\b|flow|유량).*(뭐|what)|(Q|flow|유량)\s*가\s*뭐", re.I),
+}
+
+# '...가 뭐야', '...의 뜻' 패턴 추가
+_CONCEPT_PATTERNS_TO_ADD = {
+    "V": [re.compile(r"(bed\s*volum.*)\s*(뭐|무엇|뜻)", re.I), re.compile(r"(볼륨|체적)\s*(뭐|뜻)", re.I)],
+    "Q": [re.compile(r"(flow|유량)\s*(뭐|뜻)", re.I)],
+    "EBCT": [re.compile(r"ebct\s*(뭐|뜻)", re.I)],
+}
+
 def query_concept(graph: nx.DiGraph, user_msg: str) -> Optional[Tuple[str, str]]:
     """
     Queries the graph for a concept based on the user's message.
@@ -91,29 +154,14 @@ def query_concept(graph: nx.DiGraph, user_msg: str) -> Optional[Tuple[str, str]]
     """
     user_msg = user_msg.strip().lower()
 
-    # Simple regex for now, can be improved with NLP
-    patterns = {
-        "EBCT": re.compile(r"(ebct가\s*뭐|what\s*is\s*ebct)", re.I),
-        "V": re.compile(r"(\bV\b|volume|볼륨).*(뭐|what)|(V|volume|볼륨)\s*가\s*뭐", re.I),
-        "Q": re.compile(r"(\bQ\b|flow|유량).*(뭐|what)|(Q|flow|유량)\s*가\s*뭐", re.I),
-    }
-
-
-    # '...가 뭐야', '...의 뜻' 패턴 추가
-    patterns_to_add = {
-        "V": [r"(bed\s*volum.*)\s*(뭐|무엇|뜻)", r"(볼륨|체적)\s*(뭐|뜻)"],
-        "Q": [r"(flow|유량)\s*(뭐|뜻)"],
-        "EBCT": [r"ebct\s*(뭐|뜻)"],
-    }
-
-    for concept_name, regex_list in patterns_to_add.items():
+    for concept_name, regex_list in _CONCEPT_PATTERNS_TO_ADD.items():
         for pattern in regex_list:
-            if re.search(pattern, user_msg, re.I):
+            if pattern.search(user_msg):
                 node = graph.nodes.get(concept_name)
                 if node and node.get('type') == 'concept':
                     return node.get('description'), node.get('rationale')
 
-    for concept_name, pattern in patterns.items():
+    for concept_name, pattern in _CONCEPT_PATTERNS.items():
         if pattern.search(user_msg):
             node = graph.nodes.get(concept_name)
             if node and node.get('type') == 'concept':
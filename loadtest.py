@@ -0,0 +1,152 @@
+"""
+EBCT 서버 부하 테스트 (표준 라이브러리만 사용).
+
+이미 떠 있는 서버에 대해:
+    python loadtest.py --url http://127.0.0.1:5001
+
+워커 수별 스윕 (gunicorn을 직접 띄우고 taskset으로 서버 코어를 워커 수만큼 고정,
+부하 클라이언트는 남는 코어에 고정):
+    python loadtest.py --sweep 1,2,4 --threads 4
+
+결과는 README 표에 그대로 붙일 수 있는 Markdown 행으로 출력한다.
+"""
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import threading
+import time
+from urllib.parse import urlparse
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# (이름, method, path, body)
+ROUTES = [
+    ("/api/knowledge-graph", "GET", "/api/knowledge-graph", None),
+    ("/api/chat", "POST", "/api/chat",
+     {"messages": [{"role": "user", "content": "what is ebct"}], "state": {"role": "engineer"}}),
+    ("/api/calculate", "POST", "/api/calculate", {"query": "flow 800 gpm, bed volume 9600 gal"}),
+]
+
+
+def _client_loop(host, port, method, path, body, deadline, counts):
+    """Keep-alive 연결 하나로 deadline까지 요청을 반복한다."""
+    headers = {"Content-Type": "application/json"} if body is not None else {}
+    conn = None
+    while time.time() < deadline:
+        try:
+            if conn is None:
+                conn = http.client.HTTPConnection(host, port, timeout=10)
+            conn.request(method, path, body=body, headers=headers)
+            resp = conn.getresponse()
+            resp.read()
+            counts[0 if resp.status == 200 else 1] += 1
+        except Exception:
+            counts[1] += 1
+            if conn is not None:
+                conn.close()
+            conn = None
+    if conn is not None:
+        conn.close()
+
+
+def _client_proc(args):
+    """한 프로세스 안에서 n개 스레드로 부하를 건다. (ok, err)를 반환."""
+    host, port, method, path, body, deadline, n = args
+    per_thread = [[0, 0] for _ in range(n)]
+    threads = [threading.Thread(target=_client_loop, args=(host, port, method, path, body, deadline, c))
+               for c in per_thread]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return sum(c[0] for c in per_thread), sum(c[1] for c in per_thread)
+
+
+def run_route(url, method, path, body, concurrency, duration, procs):
+    """concurrency개 연결을 procs개 프로세스에 나눠 duration초 동안 돌리고 req/s를 반환."""
+    u = urlparse(url)
+    payload = json.dumps(body).encode() if body is not None else None
+    deadline = time.time() + duration
+    split = [concurrency // procs + (1 if i < concurrency % procs else 0) for i in range(procs)]
+    jobs = [(u.hostname, u.port or 80, method, path, payload, deadline, n) for n in split if n]
+    with multiprocessing.Pool(len(jobs)) as pool:
+        results = pool.map(_client_proc, jobs)
+    ok = sum(r[0] for r in results)
+    err = sum(r[1] for r in results)
+    return ok / duration, err
+
+
+def _wait_ready(url, timeout=30.0):
+    u = urlparse(url)
+    end = time.time() + timeout
+    while time.time() < end:
+        try:
+            conn = http.client.HTTPConnection(u.hostname, u.port or 80, timeout=2)
+            conn.request("GET", "/ping")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server at {url} did not become ready")
+
+
+def _start_gunicorn(workers, threads, port, cores):
+    env = dict(os.environ, WEB_CONCURRENCY=str(workers), GUNICORN_THREADS=str(threads), PORT=str(port))
+    cmd = [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "--access-logfile", "/dev/null", "app:app"]
+    if cores and shutil.which("taskset"):
+        cmd = ["taskset", "-c", ",".join(map(str, cores))] + cmd
+    return subprocess.Popen(cmd, cwd=BASE_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--url", default="http://127.0.0.1:5001")
+    ap.add_argument("--duration", type=float, default=15.0, help="seconds per route")
+    ap.add_argument("--concurrency", type=int, default=64, help="open connections")
+    ap.add_argument("--procs", type=int, default=0, help="client processes (default: client cores)")
+    ap.add_argument("--sweep", default="", help="comma-separated worker counts; starts gunicorn itself")
+    ap.add_argument("--threads", type=int, default=4, help="GUNICORN_THREADS for --sweep")
+    args = ap.parse_args()
+
+    ncpu = os.cpu_count() or 1
+    print(f"# host cores: {ncpu}, concurrency: {args.concurrency}, duration: {args.duration:g}s")
+    print("| Workers × threads | Server cores | " + " | ".join(f"`{r[0]}`" for r in ROUTES) + " |")
+    print("|---|---|" + "---|" * len(ROUTES))
+
+    if not args.sweep:
+        procs = args.procs or ncpu
+        cells = []
+        for _, method, path, body in ROUTES:
+            rps, err = run_route(args.url, method, path, body, args.concurrency, args.duration, procs)
+            cells.append(f"{rps:.0f}" + (f" ({err} err)" if err else ""))
+        print("| - | - | " + " | ".join(cells) + " |")
+        return
+
+    port = urlparse(args.url).port or 5001
+    for workers in [int(w) for w in args.sweep.split(",")]:
+        server_cores = list(range(min(workers, ncpu)))
+        client_cores = list(range(len(server_cores), ncpu)) or server_cores
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, client_cores)
+        proc = _start_gunicorn(workers, args.threads, port, server_cores if ncpu > 1 else None)
+        try:
+            _wait_ready(args.url)
+            procs = args.procs or len(client_cores)
+            cells = []
+            for _, method, path, body in ROUTES:
+                rps, err = run_route(args.url, method, path, body, args.concurrency, args.duration, procs)
+                cells.append(f"{rps:.0f}" + (f" ({err} err)" if err else ""))
+            print(f"| {workers} × {args.threads} | {len(server_cores)} | " + " | ".join(cells) + " |", flush=True)
+        finally:
+            proc.send_signal(signal.SIGTERM)
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()